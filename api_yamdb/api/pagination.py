@@ -0,0 +1,28 @@
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+class TitleCursorPagination(CursorPagination):
+    '''
+    Keyset-пагинация по id для списка произведений.
+
+    В отличие от постраничной пагинации не использует OFFSET, а читает
+    диапазон по индексу id. Параметр count сохранён для совместимости
+    с контрактом API.
+    '''
+
+    ordering = 'id'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = queryset.count()
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                'count': self.count,
+                'next': self.get_next_link(),
+                'previous': self.get_previous_link(),
+                'results': data,
+            }
+        )
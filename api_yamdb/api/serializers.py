@@ -1,7 +1,6 @@
 import datetime as dt
 
 from django.contrib.auth.tokens import default_token_generator
-from django.db.models import Avg
 from django.shortcuts import get_object_or_404
 from rest_framework import serializers
 from reviews.models import Category, Comment, Genre, Review, Title
@@ -25,29 +24,6 @@ class UserSignupSerializer(serializers.Serializer):
             )
         return value
 
-    def validate(self, data):
-        '''
-        Возможность получить токен для существующей комбинации username и email
-        и обеспечить уникальность username и email
-        '''
-        if (
-            User.objects.filter(email=data['email'])
-            .exclude(username=data['username'])
-            .exists()
-        ):
-            raise serializers.ValidationError(
-                'Указанный email уже существует!'
-            )
-        if (
-            User.objects.filter(username=data['username'])
-            .exclude(email=data['email'])
-            .exists()
-        ):
-            raise serializers.ValidationError(
-                'Указанный username уже существует!'
-            )
-        return data
-
 
 class UserTokenSerializer(serializers.Serializer):
     username = serializers.CharField(max_length=150, write_only=True)
@@ -58,12 +34,12 @@ class UserTokenSerializer(serializers.Serializer):
         fields = ('username', 'confirmation_code')
 
     def validate(self, data):
-        user = get_object_or_404(
+        self.user = get_object_or_404(
             User,
             username=data['username'],
         )
         token = data['confirmation_code']
-        if not default_token_generator.check_token(user, token):
+        if not default_token_generator.check_token(self.user, token):
             raise serializers.ValidationError(
                 'Некорректный confirmation_code!'
             )
@@ -101,8 +77,11 @@ class GenreSerializer(serializers.ModelSerializer):
         )
 
 
-class TitleListSerializer(serializers.ModelSerializer):
-    rating = serializers.SerializerMethodField(required=False)
+class TitleBaseSerializer(serializers.ModelSerializer):
+    rating = serializers.IntegerField(read_only=True, allow_null=True)
+
+
+class TitleListSerializer(TitleBaseSerializer):
     genre = GenreSerializer(many=True)
     category = CategorySerializer()
 
@@ -118,20 +97,10 @@ class TitleListSerializer(serializers.ModelSerializer):
             'category',
         )
 
-    def get_rating(self, obj):
-        rating_agv = obj.reviews.aggregate(Avg('score'))['score__avg']
-        if isinstance(rating_agv, float):
-            rating = round(rating_agv)
-            return rating
 
-
-class TitleSerializer(serializers.ModelSerializer):
-    genre = serializers.SlugRelatedField(
-        queryset=Genre.objects.all(), slug_field='slug', many=True
-    )
-    category = serializers.SlugRelatedField(
-        queryset=Category.objects.all(), slug_field='slug'
-    )
+class TitleSerializer(TitleBaseSerializer):
+    genre = serializers.ListField(child=serializers.SlugField())
+    category = serializers.SlugField()
 
     class Meta:
         model = Title
@@ -139,6 +108,7 @@ class TitleSerializer(serializers.ModelSerializer):
             'id',
             'name',
             'year',
+            'rating',
             'description',
             'genre',
             'category',
@@ -152,6 +122,28 @@ class TitleSerializer(serializers.ModelSerializer):
             )
         return value
 
+    def validate_genre(self, slugs):
+        '''Разрешает все слаги жанров одним запросом вместо N.'''
+        genres = Genre.objects.in_bulk(slugs, field_name='slug')
+        missing = set(slugs) - set(genres)
+        if missing:
+            raise serializers.ValidationError(
+                f'Жанры {", ".join(sorted(missing))} не существуют!'
+            )
+        return list(genres.values())
+
+    def validate_category(self, slug):
+        try:
+            return Category.objects.get(slug=slug)
+        except Category.DoesNotExist:
+            raise serializers.ValidationError(
+                f'Категория {slug} не существует!'
+            )
+
+    def to_representation(self, instance):
+        '''Отдаёт объект в формате чтения: вложенные объекты вместо слагов.'''
+        return TitleListSerializer(instance, context=self.context).data
+
 
 class ReviewSerializer(serializers.ModelSerializer):
     author = serializers.SlugRelatedField(
@@ -168,17 +160,6 @@ class ReviewSerializer(serializers.ModelSerializer):
             'pub_date',
         )
 
-    def validate(self, data):
-        request = self.context.get('request')
-        if request.method == 'POST':
-            title_id = (self.context['view'].kwargs.get('title_id'),)
-            author = self.context['request'].user
-            if Review.objects.filter(title=title_id, author=author).exists():
-                raise serializers.ValidationError(
-                    'Вы уже оставляли отзыв на это произведение.'
-                )
-        return data
-
 
 class CommentSerializer(serializers.ModelSerializer):
     author = serializers.SlugRelatedField(
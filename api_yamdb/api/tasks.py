@@ -0,0 +1,20 @@
+'''
+Задачи, вынесенные из обработчиков запросов.
+'''
+from django.contrib.auth.tokens import default_token_generator
+
+from users.models import User
+
+
+def send_confirmation_email(user_id):
+    '''
+    Отправляет пользователю письмо с кодом подтверждения регистрации.
+
+    Принимает только id пользователя, чтобы вызов можно было отдать
+    в очередь задач (Celery/Django-Q), когда она появится в проекте.
+    '''
+    user = User.objects.get(pk=user_id)
+    code = default_token_generator.make_token(user)
+    subject = 'Код подтверждения регистрации на YaMDb'
+    message = f'Привет {user}, твой код подтверждения: {code}'
+    user.email_user(subject, message)
@@ -1,17 +1,27 @@
-from django.contrib.auth.tokens import default_token_generator
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, mixins
 from rest_framework import permissions as rest_permissions
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.generics import CreateAPIView
 from rest_framework.response import Response
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 from reviews.models import Category, Genre, Review, Title
 from users.models import User
 
-from api import filter, permissions, serializers
+from api import filter, pagination, permissions, serializers, tasks
+
+# Обращение к настройке при импорте кладёт ключ подписи в кэш
+# api_settings, чтобы не читать настройки при выдаче каждого токена.
+jwt_settings.SIGNING_KEY
 
 
 class UserSignupView(CreateAPIView):
@@ -29,17 +39,19 @@ class UserSignupView(CreateAPIView):
         )
 
     def perform_create(self, serializer):
-        user, created = User.objects.get_or_create(
-            username=serializer.validated_data['username'],
-            email=serializer.validated_data['email'],
-        )
+        try:
+            user, created = User.objects.get_or_create(
+                username=serializer.validated_data['username'],
+                email=serializer.validated_data['email'],
+            )
+        except IntegrityError:
+            raise ValidationError(
+                'Пользователь с таким email или username уже существует!'
+            )
         if created:
             user.is_active = False
             user.save()
-        code = default_token_generator.make_token(user)
-        subject = 'Код подтверждения регистрации на YaMDb'
-        message = f'Привет {user}, твой код подтверждения: {code}'
-        user.email_user(subject, message)
+        tasks.send_confirmation_email(user.pk)
 
 
 class UserTokenView(CreateAPIView):
@@ -50,9 +62,7 @@ class UserTokenView(CreateAPIView):
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        user = get_object_or_404(
-            User, username=serializer.validated_data['username']
-        )
+        user = serializer.user
         refresh = RefreshToken.for_user(user)
         serializer.validated_data['token'] = str(refresh.access_token)
         if not user.is_active:
@@ -70,7 +80,9 @@ class UserTokenView(CreateAPIView):
 
 class UserViewSet(viewsets.ModelViewSet):
     filter_backends = (filters.SearchFilter,)
-    queryset = User.objects.order_by('id')
+    queryset = User.objects.only(
+        'username', 'email', 'first_name', 'last_name', 'bio', 'role'
+    ).order_by('id')
     search_fields = ('username',)
     serializer_class = serializers.UserSerializer
     permission_classes = (permissions.IsAdmin,)
@@ -107,11 +119,34 @@ class CreateListDeleteViewSet(
     mixins.DestroyModelMixin,
     viewsets.GenericViewSet,
 ):
-    pass
+    '''
+    Список кэшируется на уровне view: категории и жанры меняются редко,
+    а запрашиваются часто. Кэш сбрасывается при создании и удалении.
+    '''
+
+    @method_decorator(cache_page(60))
+    def list(self, request, *args, **kwargs):
+        # Отдаём словари из values() напрямую: для плоских объектов
+        # это заметно дешевле, чем ModelSerializer на каждую строку.
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            *self.get_serializer_class().Meta.fields
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(list(queryset))
+
+    def perform_create(self, serializer):
+        serializer.save()
+        cache.clear()
+
+    def perform_destroy(self, instance):
+        instance.delete()
+        cache.clear()
 
 
 class CategoryViewSet(CreateListDeleteViewSet):
-    queryset = Category.objects.order_by('name')
+    queryset = Category.objects.only('name', 'slug').order_by('name')
     serializer_class = serializers.CategorySerializer
     permission_classes = (permissions.IsAdminOrReadOnly,)
     filter_backends = (filters.SearchFilter,)
@@ -120,7 +155,7 @@ class CategoryViewSet(CreateListDeleteViewSet):
 
 
 class GenreViewSet(CreateListDeleteViewSet):
-    queryset = Genre.objects.order_by('name')
+    queryset = Genre.objects.only('name', 'slug').order_by('name')
     serializer_class = serializers.GenreSerializer
     permission_classes = (permissions.IsAdminOrReadOnly,)
     filter_backends = (filters.SearchFilter,)
@@ -129,11 +164,29 @@ class GenreViewSet(CreateListDeleteViewSet):
 
 
 class TitleViewSet(viewsets.ModelViewSet):
-    queryset = Title.objects.order_by('id')
     serializer_class = serializers.TitleListSerializer
     permission_classes = (permissions.IsAdminOrReadOnly,)
     filter_backends = (DjangoFilterBackend,)
     filterset_class = filter.TitleFilter
+    pagination_class = pagination.TitleCursorPagination
+
+    def get_queryset(self):
+        return (
+            Title.objects.select_related('category')
+            .prefetch_related(
+                Prefetch('genre', queryset=Genre.objects.only('name', 'slug'))
+            )
+            .only(
+                'id',
+                'name',
+                'year',
+                'rating',
+                'description',
+                'category__name',
+                'category__slug',
+            )
+            .order_by('id')
+        )
 
     def get_serializer_class(self):
         if self.action in ('list', 'retrieve'):
@@ -164,29 +217,43 @@ class ReviewViewSet(viewsets.ModelViewSet):
     serializer_class = serializers.ReviewSerializer
     permission_classes = (permissions.ReviewAndComment,)
 
+    def get_title(self):
+        if not hasattr(self, '_title'):
+            self._title = get_object_or_404(
+                Title, id=self.kwargs.get('title_id')
+            )
+        return self._title
+
     def get_queryset(self):
-        title_id = self.kwargs.get('title_id')
-        title = get_object_or_404(Title, id=title_id)
-        return title.reviews.all()
+        return self.get_title().reviews.all()
 
     def perform_create(self, serializer):
-        title_id = self.kwargs.get('title_id')
-        title = get_object_or_404(Title, id=title_id)
-        serializer.save(author=self.request.user, title=title)
+        try:
+            with transaction.atomic():
+                serializer.save(
+                    author=self.request.user, title=self.get_title()
+                )
+        except IntegrityError:
+            raise ValidationError(
+                'Вы уже оставляли отзыв на это произведение.'
+            )
 
 
 class CommentViewSet(viewsets.ModelViewSet):
     serializer_class = serializers.CommentSerializer
     permission_classes = (permissions.ReviewAndComment,)
 
+    def get_review(self):
+        if not hasattr(self, '_review'):
+            self._review = get_object_or_404(
+                Review,
+                id=self.kwargs.get('review_id'),
+                title=self.kwargs.get('title_id'),
+            )
+        return self._review
+
     def get_queryset(self):
-        title_id = self.kwargs.get('title_id')
-        review_id = self.kwargs.get('review_id')
-        review = get_object_or_404(Review, id=review_id, title=title_id)
-        return review.comments.all()
+        return self.get_review().comments.all()
 
     def perform_create(self, serializer):
-        title_id = self.kwargs.get('title_id')
-        review_id = self.kwargs.get('review_id')
-        review = get_object_or_404(Review, id=review_id, title=title_id)
-        serializer.save(author=self.request.user, review=review)
+        serializer.save(author=self.request.user, review=self.get_review())
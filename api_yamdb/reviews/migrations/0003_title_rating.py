@@ -0,0 +1,18 @@
+# Generated by Django 2.2.16 on 2026-08-27 09:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0002_auto_20220523_2205'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='title',
+            name='rating',
+            field=models.FloatField(null=True),
+        ),
+    ]
@@ -0,0 +1,33 @@
+from django.db import migrations
+from django.db.models import Avg, OuterRef, Subquery
+from django.db.models.functions import Round
+
+
+def backfill_rating(apps, schema_editor):
+    '''Заполняет рейтинг уже существующих произведений по их отзывам.'''
+    Review = apps.get_model('reviews', 'Review')
+    Title = apps.get_model('reviews', 'Title')
+    Title.objects.update(
+        rating=Subquery(
+            Review.objects.filter(title=OuterRef('id'))
+            .values('title')
+            .annotate(rating=Round(Avg('score')))
+            .values('rating')
+        )
+    )
+
+
+def clear_rating(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    Title.objects.update(rating=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0005_auto_20260827_0920'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_rating, clear_rating),
+    ]
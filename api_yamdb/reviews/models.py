@@ -4,7 +4,7 @@ from users.models import User
 
 
 class Category(models.Model):
-    name = models.CharField(max_length=256)
+    name = models.CharField(max_length=256, db_index=True)
     slug = models.SlugField(unique=True)
 
     def __str__(self):
@@ -12,7 +12,7 @@ class Category(models.Model):
 
 
 class Genre(models.Model):
-    name = models.CharField(max_length=256)
+    name = models.CharField(max_length=256, db_index=True)
     slug = models.SlugField(unique=True)
 
     def __str__(self):
@@ -21,7 +21,8 @@ class Genre(models.Model):
 
 class Title(models.Model):
     name = models.CharField(max_length=256)
-    year = models.IntegerField()
+    year = models.IntegerField(db_index=True)
+    rating = models.FloatField(null=True)
     description = models.TextField(null=True)
     genre = models.ManyToManyField(Genre)
     category = models.ForeignKey(
@@ -51,6 +52,9 @@ class Review(models.Model):
     class Meta:
         ordering = ['id']
         verbose_name = 'Отзыв'
+        indexes = [
+            models.Index(fields=['title', '-pub_date']),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=(
@@ -0,0 +1,17 @@
+from django.db.models import Avg
+from django.db.models.functions import Round
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from reviews.models import Review, Title
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def update_title_rating(sender, instance, **kwargs):
+    '''Пересчитывает рейтинг произведения при изменении его отзывов.'''
+    Title.objects.filter(id=instance.title_id).update(
+        rating=Review.objects.filter(title_id=instance.title_id).aggregate(
+            rating=Round(Avg('score'))
+        )['rating']
+    )